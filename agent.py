@@ -12,13 +12,14 @@ Usage:
 
 import argparse
 import json
+import logging
 import sys
 
 import anthropic
 
 import config
 from connect import get_session
-from fetch_data import fetch_candles
+from fetch_data import HEADER, fetch_candles, format_row
 
 # --- Claude setup ---
 
@@ -51,15 +52,17 @@ outside the JSON. The JSON must have exactly these fields:
 def format_candles_for_prompt(candles: list, symbol: str) -> str:
     """Format candle data as a readable text table for Claude."""
     lines = [f"Stock: {symbol} (NSE) — Last {len(candles)} trading days\n"]
-    lines.append(f"{'Date':<12} {'Open':>10} {'High':>10} {'Low':>10} {'Close':>10} {'Volume':>12}")
+    lines.append(HEADER)
     lines.append("─" * 68)
 
+    # The timestamp type is the same for every candle, so pick the date extractor once
+    if candles and isinstance(candles[0][0], str):
+        get_date = lambda candle: candle[0][:10]
+    else:
+        get_date = lambda candle: str(candle[0])[:10]
+
     for candle in candles:
-        date_str = candle[0][:10] if isinstance(candle[0], str) else str(candle[0])[:10]
-        lines.append(
-            f"{date_str:<12} {candle[1]:>10.2f} {candle[2]:>10.2f} "
-            f"{candle[3]:>10.2f} {candle[4]:>10.2f} {candle[5]:>12,}"
-        )
+        lines.append(format_row(get_date(candle), *candle[1:6]))
 
     return "\n".join(lines)
 
@@ -166,6 +169,7 @@ def main():
     parser.add_argument("--token", default="2885", help="SmartAPI symbol token (default: 2885)")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     print(f"Connecting to AngelOne SmartAPI...")
     smart_api = get_session()
 
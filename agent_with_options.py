@@ -1,6 +1,17 @@
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
 import calendar
 
+
+@lru_cache(maxsize=32)
+def _last_thursday(year: int, month: int) -> date:
+    """Return the last Thursday of the given month."""
+    first_weekday, last_day = calendar.monthrange(year, month)
+    last_day_weekday = (first_weekday + last_day - 1) % 7
+    offset = (last_day_weekday - calendar.THURSDAY) % 7
+    return date(year, month, last_day - offset)
+
+
 def get_next_expiry_date():
     """
     Returns the next expiry date for options.
@@ -8,14 +19,16 @@ def get_next_expiry_date():
     The expiry date is the last Thursday of the month. If today is 
     a Thursday, the expiry date for the current month is returned.
     """
-    today = datetime.now()
-    first_day_next_month = (today.replace(day=1) + timedelta(days=31)).replace(day=1)
-    last_thursday_next_month = first_day_next_month + timedelta(days=(3 - first_day_next_month.weekday()) % 7 + 21)
-    return last_thursday_next_month.date()
+    today = date.today()
+    expiry = _last_thursday(today.year, today.month)
+    if today > expiry:
+        year, month = today.year + (today.month == 12), today.month % 12 + 1
+        return _last_thursday(year, month)
+    return expiry
 
 def fetch_option_chain():
     expiry_date = get_next_expiry_date()
     # Logic to fetch the option chain based on expiry_date
     pass
 
-# Other functions remain unchanged below...
\ No newline at end of file
+# Other functions remain unchanged below...
@@ -7,30 +7,50 @@ so nothing sensitive ends up in source control.
 
 import os
 import sys
-from dotenv import load_dotenv
+from functools import lru_cache
+from types import MappingProxyType
 
-load_dotenv()
+REQUIRED_KEYS = (
+    "ANGELONE_API_KEY",
+    "ANGELONE_CLIENT_ID",
+    "ANGELONE_PASSWORD",
+    "ANGELONE_TOTP_SECRET",
+    "ANTHROPIC_API_KEY",
+)
 
-ANGELONE_API_KEY = os.getenv("ANGELONE_API_KEY")
-ANGELONE_CLIENT_ID = os.getenv("ANGELONE_CLIENT_ID")
-ANGELONE_PASSWORD = os.getenv("ANGELONE_PASSWORD")
-ANGELONE_TOTP_SECRET = os.getenv("ANGELONE_TOTP_SECRET")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+# Prefer the module generated by tools/compile_env.py: it loads from cached bytecode,
+# so .env doesn't have to be read and parsed on every run. Real environment variables
+# still take precedence, same as with load_dotenv().
+try:
+    import config_compiled as _compiled
 
+    _defaults = {key: getattr(_compiled, key, None) for key in REQUIRED_KEYS}
+    _COMPILED = True
+except ImportError:
+    from dotenv import load_dotenv
 
+    load_dotenv()
+    _defaults = {}
+    _COMPILED = False
+
+# Read-only snapshot of the environment, taken once at import
+_ENV = MappingProxyType({key: os.environ.get(key, _defaults.get(key)) for key in REQUIRED_KEYS})
+
+ANGELONE_API_KEY = _ENV["ANGELONE_API_KEY"]
+ANGELONE_CLIENT_ID = _ENV["ANGELONE_CLIENT_ID"]
+ANGELONE_PASSWORD = _ENV["ANGELONE_PASSWORD"]
+ANGELONE_TOTP_SECRET = _ENV["ANGELONE_TOTP_SECRET"]
+ANTHROPIC_API_KEY = _ENV["ANTHROPIC_API_KEY"]
+
+
+@lru_cache(maxsize=1)
 def validate() -> bool:
-    """Check that all required credentials are present. Prints what's missing."""
-    missing = []
-    if not ANGELONE_API_KEY:
-        missing.append("ANGELONE_API_KEY")
-    if not ANGELONE_CLIENT_ID:
-        missing.append("ANGELONE_CLIENT_ID")
-    if not ANGELONE_PASSWORD:
-        missing.append("ANGELONE_PASSWORD")
-    if not ANGELONE_TOTP_SECRET:
-        missing.append("ANGELONE_TOTP_SECRET")
-    if not ANTHROPIC_API_KEY:
-        missing.append("ANTHROPIC_API_KEY")
+    """
+    Check that all required credentials are present. Prints what's missing.
+
+    The environment is snapshotted at import, so the result is cached after the first call.
+    """
+    missing = [key for key in REQUIRED_KEYS if not _ENV[key]]
 
     if missing:
         print("Missing credentials in .env file:")
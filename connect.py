@@ -8,13 +8,132 @@ Usage:
 
     # As a script (to test your credentials)
     python connect.py
+
+Session tokens are cached in ~/.cache/financial-agent/session.json (owner-only)
+so consecutive script runs skip the TOTP + login round-trip. Delete the file
+to force a fresh login.
 """
 
+import json
+import logging
+import os
 import sys
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
 import pyotp
+import requests
+import SmartApi.smartConnect
+from requests.adapters import HTTPAdapter
 from SmartApi import SmartConnect
+from urllib3.util.retry import Retry
+
 import config
 
+log = logging.getLogger(__name__)
+
+# SmartConnect parses every response with the stdlib json module it imported. Swap
+# in a copy of that module whose loads() is orjson's, which is several times faster
+# on large candle and order book payloads; everything else is still the stdlib's.
+SmartApi.smartConnect.json = SimpleNamespace(**{**vars(json), "loads": orjson.loads})
+
+SESSION_CACHE_PATH = Path.home() / ".cache" / "financial-agent" / "session.json"
+# AngelOne sessions end at midnight IST, so a cached session never outlives the day
+SESSION_CACHE_TTL = 7 * 60 * 60
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+@lru_cache(maxsize=1)
+def _totp() -> pyotp.TOTP:
+    """Build the TOTP generator once per process; only .now() runs on later logins."""
+    return pyotp.TOTP(config.ANGELONE_TOTP_SECRET)
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Shared keep-alive HTTP session for SmartAPI calls.
+
+    Reusing one pooled session means the TCP/TLS handshake is paid once per host
+    instead of once per API call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# SmartConnect._request sends every API call through the module-level
+# requests.request() rather than its own reqsession, so point the SDK's `requests`
+# reference at a copy of the module whose request() goes through the shared pool.
+SmartApi.smartConnect.requests = SimpleNamespace(
+    **{**vars(requests), "request": lambda *args, **kwargs: _http_session().request(*args, **kwargs)}
+)
+
+
+def _load_cached_tokens() -> dict | None:
+    """Return the cached session tokens for this client, or None if missing or expired."""
+    try:
+        cached = json.loads(SESSION_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("client") != config.ANGELONE_CLIENT_ID:
+        return None
+    if cached.get("exp", 0) <= time.time():
+        return None
+    return cached
+
+
+def _session_expiry(now: float) -> float:
+    """Timestamp when a session created at `now` should stop being reused."""
+    today_ist = datetime.fromtimestamp(now, IST).date()
+    next_midnight = datetime.combine(today_ist + timedelta(days=1), dt_time(), IST)
+    return min(now + SESSION_CACHE_TTL, next_midnight.timestamp())
+
+
+def _save_cached_tokens(smart_api: SmartConnect) -> None:
+    """Persist the session tokens so the next run can skip login."""
+    cached = {
+        "client": config.ANGELONE_CLIENT_ID,
+        "jwt": smart_api.access_token,
+        "refresh": smart_api.refresh_token,
+        "feed": smart_api.feed_token,
+        "exp": _session_expiry(time.time()),
+    }
+    try:
+        SESSION_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(SESSION_CACHE_PATH, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cached, f)
+    except OSError as e:
+        log.warning("Could not cache session tokens: %s", e)
+
+
+def _clear_cached_tokens() -> None:
+    """Drop the cached tokens, e.g. after the API rejects them."""
+    try:
+        SESSION_CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _prepare(smart_api: SmartConnect) -> SmartConnect:
+    """Settings shared by fresh and cached sessions."""
+    # If the tokens get rejected, make the next run log in from scratch
+    smart_api.setSessionExpiryHook(_clear_cached_tokens)
+    return smart_api
+
 
 def get_session() -> SmartConnect:
     """
@@ -24,22 +143,45 @@ def get_session() -> SmartConnect:
     if not config.validate():
         sys.exit(1)
 
+    cached = _load_cached_tokens()
+    if cached:
+        smart_api = SmartConnect(
+            api_key=config.ANGELONE_API_KEY,
+            access_token=cached["jwt"],
+            refresh_token=cached["refresh"],
+            feed_token=cached["feed"],
+            userId=config.ANGELONE_CLIENT_ID,
+        )
+        _prepare(smart_api)
+
+        # A cheap authenticated call tells us whether the tokens are still accepted;
+        # AngelOne reports rejected tokens as status False rather than an exception
+        try:
+            profile = smart_api.getProfile(cached["refresh"]) or {"status": False}
+        except Exception as e:
+            profile = {"status": False, "message": str(e)}
+        if profile.get("status") is not False:
+            log.info("Reusing cached session for client: %s", config.ANGELONE_CLIENT_ID)
+            return smart_api
+
+        log.info("Cached session rejected (%s); logging in again.", profile.get("message"))
+        _clear_cached_tokens()
+
     # Generate the current TOTP code from the secret
-    print("Generating TOTP...")
+    log.info("Generating TOTP...")
     try:
-        totp = pyotp.TOTP(config.ANGELONE_TOTP_SECRET)
-        totp_code = totp.now()
+        totp_code = _totp().now()
     except Exception as e:
-        print(f"Failed to generate TOTP. Is your TOTP_SECRET correct?")
-        print(f"  Error: {e}")
-        print(f"  The secret should be a base32 string (letters A-Z, digits 2-7)")
+        log.error("Failed to generate TOTP. Is your TOTP_SECRET correct?")
+        log.error("  Error: %s", e)
+        log.error("  The secret should be a base32 string (letters A-Z, digits 2-7)")
         sys.exit(1)
 
     # Create SmartAPI connection
     smart_api = SmartConnect(api_key=config.ANGELONE_API_KEY)
 
     # Authenticate
-    print("Authenticating with AngelOne SmartAPI...")
+    log.info("Authenticating with AngelOne SmartAPI...")
     try:
         session = smart_api.generateSession(
             clientCode=config.ANGELONE_CLIENT_ID,
@@ -47,33 +189,37 @@ def get_session() -> SmartConnect:
             totp=totp_code,
         )
     except Exception as e:
-        print(f"Authentication failed: {e}")
-        print("\nTroubleshooting:")
-        print("  1. Check your ANGELONE_CLIENT_ID (format: A12345678)")
-        print("  2. Check your ANGELONE_PASSWORD (your trading PIN)")
-        print("  3. Make sure TOTP is enabled in the AngelOne app")
-        print("  4. Check your API key at smartapi.angelbroking.com")
+        log.error("Authentication failed: %s", e)
+        log.error("\nTroubleshooting:")
+        log.error("  1. Check your ANGELONE_CLIENT_ID (format: A12345678)")
+        log.error("  2. Check your ANGELONE_PASSWORD (your trading PIN)")
+        log.error("  3. Make sure TOTP is enabled in the AngelOne app")
+        log.error("  4. Check your API key at smartapi.angelbroking.com")
         sys.exit(1)
 
     if session.get("status") is False:
         msg = session.get("message", "Unknown error")
-        print(f"Login failed: {msg}")
+        log.error("Login failed: %s", msg)
         if "Invalid" in msg:
-            print("  Double-check your client ID and password in .env")
+            log.error("  Double-check your client ID and password in .env")
         sys.exit(1)
 
     # Pull tokens from the session
     auth_token = session["data"]["jwtToken"]
     feed_token = smart_api.getfeedToken()
 
-    print("Login successful!")
-    print(f"Session token: {auth_token[:20]}...")
-    print(f"Feed token: {feed_token}")
-    print(f"Connected as client: {config.ANGELONE_CLIENT_ID}")
+    _prepare(smart_api)
+    _save_cached_tokens(smart_api)
+
+    log.info("Login successful!")
+    log.info("Session token: %.20s...", auth_token)
+    log.info("Feed token: %s", feed_token)
+    log.info("Connected as client: %s", config.ANGELONE_CLIENT_ID)
 
     return smart_api
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     smart_api = get_session()
-    print("\nConnection test passed. You're good to go.")
+    log.info("\nConnection test passed. You're good to go.")
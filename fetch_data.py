@@ -10,12 +10,28 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from connect import get_session
 
+log = logging.getLogger(__name__)
+
+# AngelOne's historical candle API rate limit
+CANDLE_REQUESTS_PER_SECOND = 3
+
+_MARKET_OPEN = " 09:15"
+_MARKET_CLOSE = " 15:30"
+HEADER = f"{'Date':<12} {'Open':>10} {'High':>10} {'Low':>10} {'Close':>10} {'Volume':>12}"
+_SEPARATOR = "─" * len(HEADER)
+# Bound once so each row is a single method call rather than a re-parsed f-string
+format_row = "{:<12} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f} {:>12,}".format
+
 
 def fetch_candles(
     smart_api,
@@ -41,37 +57,106 @@ def fetch_candles(
         List of candle data [timestamp, open, high, low, close, volume]
         or None if the request failed.
     """
-    to_date = datetime.now()
-    from_date = to_date - timedelta(days=days)
+    results = fetch_candles_batch(
+        smart_api,
+        [{"symbol": symbol, "token": token}],
+        exchange=exchange,
+        interval=interval,
+        days=days,
+    )
+    return results[token]
 
-    params = {
-        "exchange": exchange,
-        "symboltoken": token,
-        "interval": interval,
-        "fromdate": from_date.strftime("%Y-%m-%d 09:15"),
-        "todate": to_date.strftime("%Y-%m-%d 15:30"),
-    }
 
-    print(f"Fetching {days} days of daily data for {symbol}...")
+def fetch_candles_batch(
+    smart_api,
+    items: list,
+    exchange: str = "NSE",
+    interval: str = "ONE_DAY",
+    days: int = 30,
+    max_workers: int = 3,
+) -> dict:
+    """
+    Fetch historical candle data for several stocks concurrently.
 
-    try:
-        response = smart_api.getCandleData(params)
-    except Exception as e:
-        print(f"API call failed: {e}")
-        return None
+    SmartAPI has no multi-symbol candle endpoint, so the requests are issued in
+    parallel from a thread pool instead of one round-trip after another. The
+    historical endpoint allows about 3 requests per second, so submissions are
+    spaced out to stay under CANDLE_REQUESTS_PER_SECOND; requests over the limit
+    would be rejected and show up here as None.
 
+    Args:
+        smart_api: Authenticated SmartConnect session
+        items: List of {"symbol": ..., "token": ...} dicts
+        exchange: Exchange — "NSE" or "BSE"
+        interval: Candle interval (see fetch_candles)
+        days: Number of days of history to fetch
+        max_workers: Maximum number of requests in flight at once (default 3)
+
+    Returns:
+        Dict mapping each token to its candle list, or None if that request failed.
+    """
+    if not items:
+        return {}
+
+    # The date range is the same for every item, and for every call on the same day
+    fromdate, todate = _range_strs(date.today().toordinal(), days)
+
+    results = {}
+    workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        started = time.monotonic()
+        for i, item in enumerate(items):
+            # Submit request i no earlier than i / rate seconds after the first
+            delay = started + i / CANDLE_REQUESTS_PER_SECOND - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            params = {
+                "exchange": exchange,
+                "symboltoken": item["token"],
+                "interval": interval,
+                "fromdate": fromdate,
+                "todate": todate,
+            }
+            log.info("Fetching %d days of daily data for %s...", days, item["symbol"])
+            futures[executor.submit(smart_api.getCandleData, params)] = item
+
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                log.error("API call failed for %s: %s", item["symbol"], e)
+                results[item["token"]] = None
+                continue
+            results[item["token"]] = _candles_from_response(response)
+
+    return results
+
+
+@lru_cache(maxsize=64)
+def _range_strs(today_ord: int, days: int) -> tuple[str, str]:
+    """Return the (fromdate, todate) strings for a `days`-long window ending on the given day."""
+    to_date = date.fromordinal(today_ord)
+    from_date = to_date - timedelta(days=days)
+    return f"{from_date.isoformat()}{_MARKET_OPEN}", f"{to_date.isoformat()}{_MARKET_CLOSE}"
+
+
+def _candles_from_response(response: Optional[dict]) -> Optional[list]:
+    """Pull the candle list out of a getCandleData response, or None on error."""
     if response is None:
-        print("Got empty response from SmartAPI. Check your symbol token.")
+        log.error("Got empty response from SmartAPI. Check your symbol token.")
         return None
 
     if response.get("status") is False:
-        print(f"API error: {response.get('message', 'Unknown error')}")
+        log.error("API error: %s", response.get("message", "Unknown error"))
         return None
 
     candles = response.get("data")
     if not candles:
-        print("No candle data returned. The symbol token might be wrong,")
-        print("or the market might be closed for the requested period.")
+        log.warning("No candle data returned. The symbol token might be wrong,")
+        log.warning("or the market might be closed for the requested period.")
         return None
 
     return candles
@@ -79,28 +164,23 @@ def fetch_candles(
 
 def print_candles(candles: list, symbol: str) -> None:
     """Print candle data as a clean table."""
-    header = f"{'Date':<12} {'Open':>10} {'High':>10} {'Low':>10} {'Close':>10} {'Volume':>12}"
-    separator = "─" * len(header)
-
     print(f"\n{symbol} — Daily OHLCV ({len(candles)} candles)\n")
-    print(header)
-    print(separator)
-
-    for candle in candles:
-        # candle format: [timestamp, open, high, low, close, volume]
-        ts = candle[0]
-        # Parse the timestamp — SmartAPI returns "2025-01-15T00:00:00+05:30" format
-        date_str = ts[:10] if isinstance(ts, str) else str(ts)[:10]
-        open_p = candle[1]
-        high_p = candle[2]
-        low_p = candle[3]
-        close_p = candle[4]
-        volume = candle[5]
-
-        print(
-            f"{date_str:<12} {open_p:>10.2f} {high_p:>10.2f} "
-            f"{low_p:>10.2f} {close_p:>10.2f} {volume:>12,}"
-        )
+
+    # candle format: [timestamp, open, high, low, close, volume]
+    # Transpose once into columns so the formatter is mapped over them without building
+    # a per-row argument tuple. SmartAPI returns "2025-01-15T00:00:00+05:30" strings; the
+    # type is the same for every row, so check it once instead of per candle.
+    if candles:
+        timestamps, opens, highs, lows, closes, volumes = zip(*candles)
+        if not isinstance(timestamps[0], str):
+            timestamps = map(str, timestamps)
+        dates = [ts[:10] for ts in timestamps]
+        rows = map(format_row, dates, opens, highs, lows, closes, volumes)
+    else:
+        rows = ()
+
+    # One write for the whole table instead of a print() per row
+    sys.stdout.write("\n".join((HEADER, _SEPARATOR, *rows)) + "\n")
 
 
 def main():
@@ -110,14 +190,15 @@ def main():
     parser.add_argument("--days", type=int, default=30, help="Days of history (default: 30)")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     smart_api = get_session()
     candles = fetch_candles(smart_api, symbol=args.symbol, token=args.token, days=args.days)
 
     if candles:
         print_candles(candles, args.symbol)
-        print(f"\nFetched {len(candles)} candles.")
+        log.info("\nFetched %d candles.", len(candles))
     else:
-        print("Failed to fetch data.")
+        log.error("Failed to fetch data.")
         sys.exit(1)
 
 
@@ -13,17 +13,108 @@ Usage (dry run — safe, no real orders):
 
 To enable real orders, change DRY_RUN to False in the code.
 Do this at your own risk.
+
+In live mode an interactive run waits 5 seconds so you can abort with Ctrl+C.
+Non-interactive runs (cron, CI) skip the wait; pass --yes to skip it interactively:
+    python place_order.py --yes
 """
 
+import argparse
+import asyncio
+import logging
 import sys
+from collections.abc import Iterable
+from types import MappingProxyType
+
 from connect import get_session
 
+log = logging.getLogger(__name__)
+
 # ─────────────────────────────────────────────────────────
 # SAFETY FLAG — When True, no real orders are placed.
 # Only prints what it WOULD do.
 DRY_RUN = True
 # ─────────────────────────────────────────────────────────
 
+# Complete order templates, one per order kind. _place_order merges the per-order
+# fields on top with `|`, so the static keys are never rebuilt.
+_BASE_ORDER = MappingProxyType({
+    "variety": "NORMAL",
+    "exchange": "NSE",
+    "ordertype": "MARKET",
+    "producttype": "DELIVERY",  # CNC (delivery). Use "INTRADAY" for MIS.
+    "duration": "DAY",
+    "price": 0,
+    "squareoff": 0,
+    "stoploss": 0,
+    "triggerprice": 0,
+})
+_BUY_TEMPLATE = MappingProxyType(_BASE_ORDER | {"transactiontype": "BUY"})
+_SELL_TEMPLATE = MappingProxyType(_BASE_ORDER | {"transactiontype": "SELL"})
+_SL_TEMPLATE = MappingProxyType(
+    _BASE_ORDER | {"variety": "STOPLOSS", "transactiontype": "SELL", "ordertype": "STOPLOSS_LIMIT"}
+)
+
+
+def _place_order(
+    smart_api,
+    template: MappingProxyType,
+    *,
+    symbol: str,
+    token: str,
+    qty: int,
+    ordertype: str | None = None,
+    price: float = 0,
+    trigger_price: float = 0,
+    dry_run: bool = True,
+) -> str | None:
+    """
+    Build, print and (unless dry_run) place a single order.
+
+    Starts from one of the order templates and only fills in the fields that vary per order.
+    """
+    order_params = template | {
+        "tradingsymbol": symbol,
+        "symboltoken": token,
+        "quantity": qty,
+        "price": price,
+        "triggerprice": trigger_price,
+    }
+    if ordertype is not None:
+        order_params["ordertype"] = ordertype
+    transactiontype = order_params["transactiontype"]
+    ordertype = order_params["ordertype"]
+
+    # Only build the summary when it will actually be shown
+    if log.isEnabledFor(logging.INFO):
+        lines = [
+            "\n📋 Order details:",
+            f"   Action:     {transactiontype}",
+            f"   Symbol:     {symbol}",
+            f"   Quantity:   {qty}",
+            f"   Type:       {ordertype}",
+        ]
+        if trigger_price:
+            lines.append(f"   Trigger:    ₹{trigger_price:,.2f}")
+        if price:
+            lines.append(f"   Price:      ₹{price:,.2f}")
+        lines.append("   Product:    DELIVERY (CNC)")
+        log.info("\n".join(lines))
+
+    if dry_run:
+        log.info("\n   [DRY RUN] Order NOT placed. Set dry_run=False to execute.")
+        return None
+
+    try:
+        response = smart_api.placeOrder(order_params)
+        log.info(
+            "\n   %s %s %s order placed! Order ID: %s", transactiontype, ordertype, symbol, response
+        )
+        return response
+    except Exception as e:
+        log.error("\n   %s %s %s order failed: %s", transactiontype, ordertype, symbol, e)
+        return None
+
 
 def place_buy_order(
     smart_api,
@@ -49,42 +140,16 @@ def place_buy_order(
     Returns:
         Order ID if placed, None if dry run or failed.
     """
-    order_params = {
-        "variety": "NORMAL",
-        "tradingsymbol": symbol,
-        "symboltoken": token,
-        "transactiontype": "BUY",
-        "exchange": "NSE",
-        "ordertype": order_type,
-        "producttype": "DELIVERY",  # CNC (delivery). Use "INTRADAY" for MIS.
-        "duration": "DAY",
-        "quantity": qty,
-        "price": price if order_type == "LIMIT" else 0,
-        "squareoff": 0,
-        "stoploss": 0,
-        "triggerprice": 0,
-    }
-
-    print(f"\n📋 Order details:")
-    print(f"   Action:     BUY")
-    print(f"   Symbol:     {symbol}")
-    print(f"   Quantity:   {qty}")
-    print(f"   Type:       {order_type}")
-    if order_type == "LIMIT":
-        print(f"   Price:      ₹{price:,.2f}")
-    print(f"   Product:    DELIVERY (CNC)")
-
-    if dry_run:
-        print(f"\n   [DRY RUN] Order NOT placed. Set dry_run=False to execute.")
-        return None
-
-    try:
-        response = smart_api.placeOrder(order_params)
-        print(f"\n   Order placed! Order ID: {response}")
-        return response
-    except Exception as e:
-        print(f"\n   Order failed: {e}")
-        return None
+    return _place_order(
+        smart_api,
+        _BUY_TEMPLATE,
+        symbol=symbol,
+        token=token,
+        qty=qty,
+        ordertype=order_type,
+        price=price if order_type == "LIMIT" else 0,
+        dry_run=dry_run,
+    )
 
 
 def place_sell_order(
@@ -99,41 +164,16 @@ def place_sell_order(
     """
     Place a sell order. Same as buy but with transactiontype=SELL.
     """
-    order_params = {
-        "variety": "NORMAL",
-        "tradingsymbol": symbol,
-        "symboltoken": token,
-        "transactiontype": "SELL",
-        "exchange": "NSE",
-        "ordertype": order_type,
-        "producttype": "DELIVERY",
-        "duration": "DAY",
-        "quantity": qty,
-        "price": price if order_type == "LIMIT" else 0,
-        "squareoff": 0,
-        "stoploss": 0,
-        "triggerprice": 0,
-    }
-
-    print(f"\n📋 Order details:")
-    print(f"   Action:     SELL")
-    print(f"   Symbol:     {symbol}")
-    print(f"   Quantity:   {qty}")
-    print(f"   Type:       {order_type}")
-    if order_type == "LIMIT":
-        print(f"   Price:      ₹{price:,.2f}")
-
-    if dry_run:
-        print(f"\n   [DRY RUN] Order NOT placed. Set dry_run=False to execute.")
-        return None
-
-    try:
-        response = smart_api.placeOrder(order_params)
-        print(f"\n   Order placed! Order ID: {response}")
-        return response
-    except Exception as e:
-        print(f"\n   Order failed: {e}")
-        return None
+    return _place_order(
+        smart_api,
+        _SELL_TEMPLATE,
+        symbol=symbol,
+        token=token,
+        qty=qty,
+        ordertype=order_type,
+        price=price if order_type == "LIMIT" else 0,
+        dry_run=dry_run,
+    )
 
 
 def place_stoploss_order(
@@ -152,70 +192,68 @@ def place_stoploss_order(
     For a sell SL: trigger_price < current price, price <= trigger_price.
     """
     if trigger_price <= 0 or price <= 0:
-        print("Stop-loss orders need both price and trigger_price > 0")
+        log.error("Stop-loss orders need both price and trigger_price > 0")
         return None
 
-    order_params = {
-        "variety": "STOPLOSS",
-        "tradingsymbol": symbol,
-        "symboltoken": token,
-        "transactiontype": "SELL",
-        "exchange": "NSE",
-        "ordertype": "STOPLOSS_LIMIT",
-        "producttype": "DELIVERY",
-        "duration": "DAY",
-        "quantity": qty,
-        "price": price,
-        "squareoff": 0,
-        "stoploss": 0,
-        "triggerprice": trigger_price,
-    }
-
-    print(f"\n📋 Stop-Loss Order:")
-    print(f"   Symbol:         {symbol}")
-    print(f"   Quantity:       {qty}")
-    print(f"   Trigger Price:  ₹{trigger_price:,.2f}")
-    print(f"   Limit Price:    ₹{price:,.2f}")
-
-    if dry_run:
-        print(f"\n   [DRY RUN] Order NOT placed.")
-        return None
-
-    try:
-        response = smart_api.placeOrder(order_params)
-        print(f"\n   Stop-loss order placed! Order ID: {response}")
-        return response
-    except Exception as e:
-        print(f"\n   Order failed: {e}")
-        return None
+    return _place_order(
+        smart_api,
+        _SL_TEMPLATE,
+        symbol=symbol,
+        token=token,
+        qty=qty,
+        price=price,
+        trigger_price=trigger_price,
+        dry_run=dry_run,
+    )
 
 
 def check_order_status(smart_api, order_id: str, dry_run: bool = True) -> dict | None:
     """
     Check the status of an order by order ID.
     """
+    return check_orders_status(smart_api, [order_id], dry_run=dry_run)[order_id]
+
+
+def check_orders_status(
+    smart_api, order_ids: Iterable[str], dry_run: bool = True
+) -> dict[str, dict | None]:
+    """
+    Check the status of several orders with a single order book fetch.
+
+    The order book is indexed by order ID once, so each lookup is O(1) instead of
+    a scan of the whole book per order.
+
+    Returns:
+        Dict mapping each order ID to its order book entry, or None if not found.
+    """
+    order_ids = list(order_ids)
+
     if dry_run:
-        print(f"\n   [DRY RUN] Would check status of order: {order_id}")
-        return None
+        for order_id in order_ids:
+            log.info("\n   [DRY RUN] Would check status of order: %s", order_id)
+        return dict.fromkeys(order_ids)
 
     try:
         order_book = smart_api.orderBook()
-
-        if order_book and order_book.get("data"):
-            for order in order_book["data"]:
-                if order.get("orderid") == order_id:
-                    print(f"\n   Order {order_id}:")
-                    print(f"   Status:  {order.get('orderstatus')}")
-                    print(f"   Symbol:  {order.get('tradingsymbol')}")
-                    print(f"   Qty:     {order.get('quantity')}")
-                    print(f"   Price:   {order.get('price')}")
-                    return order
-
-        print(f"   Order {order_id} not found in order book.")
-        return None
     except Exception as e:
-        print(f"   Failed to fetch order status: {e}")
-        return None
+        log.error("   Failed to fetch order status: %s", e)
+        return dict.fromkeys(order_ids)
+
+    index = {order.get("orderid"): order for order in (order_book or {}).get("data") or ()}
+
+    results = {}
+    for order_id in order_ids:
+        order = index.get(order_id)
+        if order is None:
+            log.warning("   Order %s not found in order book.", order_id)
+        else:
+            log.info("\n   Order %s:", order_id)
+            log.info("   Status:  %s", order.get("orderstatus"))
+            log.info("   Symbol:  %s", order.get("tradingsymbol"))
+            log.info("   Qty:     %s", order.get("quantity"))
+            log.info("   Price:   %s", order.get("price"))
+        results[order_id] = order
+    return results
 
 
 def cancel_order(smart_api, order_id: str, variety: str = "NORMAL", dry_run: bool = True) -> bool:
@@ -228,90 +266,119 @@ def cancel_order(smart_api, order_id: str, variety: str = "NORMAL", dry_run: boo
         variety: "NORMAL" for regular orders, "STOPLOSS" for SL orders
         dry_run: Safety flag
     """
-    print(f"\n   Cancelling order: {order_id} (variety: {variety})")
+    log.info("\n   Cancelling order: %s (variety: %s)", order_id, variety)
 
     if dry_run:
-        print(f"   [DRY RUN] Order NOT cancelled.")
+        log.info("   [DRY RUN] Order NOT cancelled.")
         return False
 
     try:
         response = smart_api.cancelOrder(order_id, variety)
-        print(f"   Order cancelled: {response}")
+        log.info("   Order cancelled: %s", response)
         return True
     except Exception as e:
-        print(f"   Cancel failed: {e}")
+        log.error("   Cancel failed: %s", e)
         return False
 
 
+async def _place_example_orders(smart_api) -> str | None:
+    """
+    Place the three independent demo orders and return the buy order's ID.
+
+    In live mode each order blocks on its own HTTPS round-trip, so they are run
+    concurrently on worker threads; dry runs stay sequential for readable output.
+    """
+    examples = [
+        ("Example 1: Market Buy Order", place_buy_order, dict(
+            symbol="RELIANCE-EQ",
+            token="2885",
+            qty=1,
+            order_type="MARKET",
+        )),
+        ("Example 2: Limit Sell Order", place_sell_order, dict(
+            symbol="RELIANCE-EQ",
+            token="2885",
+            qty=1,
+            price=1350.00,
+            order_type="LIMIT",
+        )),
+        ("Example 3: Stop-Loss Order", place_stoploss_order, dict(
+            symbol="RELIANCE-EQ",
+            token="2885",
+            qty=1,
+            price=1245.00,
+            trigger_price=1250.00,
+        )),
+    ]
+
+    if DRY_RUN:
+        results = []
+        for title, place, kwargs in examples:
+            log.info("\n--- %s ---", title)
+            results.append(place(smart_api, dry_run=DRY_RUN, **kwargs))
+    else:
+        log.info("\n--- Examples 1-3: placing %d orders concurrently ---", len(examples))
+        results = await asyncio.gather(*(
+            asyncio.to_thread(place, smart_api, dry_run=DRY_RUN, **kwargs)
+            for _, place, kwargs in examples
+        ))
+
+    return results[0]
+
+
 def main():
     """
     Demo: walks through each operation in dry-run mode.
     Nothing is actually executed unless you change DRY_RUN.
     """
+    parser = argparse.ArgumentParser(description="Order placement demo for AngelOne")
+    parser.add_argument(
+        "--yes", action="store_true", help="Skip the 5-second abort window in live mode"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     if DRY_RUN:
-        print("=" * 55)
-        print("  RUNNING IN DRY-RUN MODE — no real orders will be placed")
-        print("=" * 55)
+        log.info("=" * 55)
+        log.info("  RUNNING IN DRY-RUN MODE — no real orders will be placed")
+        log.info("=" * 55)
     else:
-        print("!" * 55)
-        print("  LIVE MODE — orders WILL be placed with real money!")
-        print("  Press Ctrl+C within 5 seconds to abort...")
-        print("!" * 55)
-        import time
-        time.sleep(5)
+        # Nobody can press Ctrl+C in a non-interactive run, so don't wait for it
+        abort_window = sys.stdin.isatty() and not args.yes
+        log.warning("!" * 55)
+        log.warning("  LIVE MODE — orders WILL be placed with real money!")
+        if abort_window:
+            log.warning("  Press Ctrl+C within 5 seconds to abort...")
+        elif args.yes:
+            log.warning("  --yes given; skipping abort window.")
+        else:
+            log.warning("  Non-interactive run detected; skipping abort window.")
+        log.warning("!" * 55)
+        if abort_window:
+            import time
+            time.sleep(5)
 
     smart_api = get_session()
 
-    # Example 1: Market buy order
-    print("\n--- Example 1: Market Buy Order ---")
-    order_id = place_buy_order(
-        smart_api,
-        symbol="RELIANCE-EQ",
-        token="2885",
-        qty=1,
-        order_type="MARKET",
-        dry_run=DRY_RUN,
-    )
-
-    # Example 2: Limit sell order
-    print("\n--- Example 2: Limit Sell Order ---")
-    place_sell_order(
-        smart_api,
-        symbol="RELIANCE-EQ",
-        token="2885",
-        qty=1,
-        price=1350.00,
-        order_type="LIMIT",
-        dry_run=DRY_RUN,
-    )
-
-    # Example 3: Stop-loss order
-    print("\n--- Example 3: Stop-Loss Order ---")
-    place_stoploss_order(
-        smart_api,
-        symbol="RELIANCE-EQ",
-        token="2885",
-        qty=1,
-        price=1245.00,
-        trigger_price=1250.00,
-        dry_run=DRY_RUN,
-    )
+    # Examples 1-3: Market buy, limit sell and stop-loss orders
+    order_id = asyncio.run(_place_example_orders(smart_api))
 
     # Example 4: Check order status (only works with a real order ID)
-    print("\n--- Example 4: Check Order Status ---")
+    log.info("\n--- Example 4: Check Order Status ---")
     if order_id:
         check_order_status(smart_api, order_id, dry_run=DRY_RUN)
     else:
-        print("   No order ID to check (dry run)")
+        log.info("   No order ID to check (dry run)")
 
     # Example 5: Cancel an order
-    print("\n--- Example 5: Cancel Order ---")
+    log.info("\n--- Example 5: Cancel Order ---")
     if order_id:
         cancel_order(smart_api, order_id, dry_run=DRY_RUN)
     else:
-        print("   No order ID to cancel (dry run)")
+        log.info("   No order ID to cancel (dry run)")
 
-    print("\nDone. All examples ran in", "DRY RUN" if DRY_RUN else "LIVE", "mode.")
+    log.info("\nDone. All examples ran in %s mode.", "DRY RUN" if DRY_RUN else "LIVE")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+Compiles .env into config_compiled.py so config.py can skip dotenv parsing.
+
+The generated module holds plain string assignments, so after the first import
+Python loads it straight from its cached bytecode instead of re-reading and
+parsing .env on every run.
+
+Usage:
+    python tools/compile_env.py
+
+Re-run it whenever .env changes. config_compiled.py contains your credentials,
+so it is git-ignored and written with owner-only permissions.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV_PATH = ROOT / ".env"
+OUTPUT_PATH = ROOT / "config_compiled.py"
+
+sys.path.insert(0, str(ROOT))
+from config import REQUIRED_KEYS  # noqa: E402
+
+
+def compile_env(env_path: Path = ENV_PATH, output_path: Path = OUTPUT_PATH) -> list:
+    """
+    Write the required keys from env_path to output_path as Python literals.
+
+    Returns the list of keys that were missing from the .env file.
+    """
+    values = dotenv_values(env_path)
+
+    lines = ['"""Generated by tools/compile_env.py from .env. Do not edit or commit."""', ""]
+    missing = []
+    for key in REQUIRED_KEYS:
+        value = values.get(key)
+        if value is None:
+            missing.append(key)
+        lines.append(f"{key} = {value!r}")
+
+    fd = os.open(output_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return missing
+
+
+if __name__ == "__main__":
+    if not ENV_PATH.exists():
+        print(f"No .env file found at {ENV_PATH}")
+        print("  cp .env.example .env")
+        sys.exit(1)
+
+    missing = compile_env()
+    print(f"Wrote {OUTPUT_PATH.name}")
+    for key in missing:
+        print(f"  Warning: {key} is not set in .env")